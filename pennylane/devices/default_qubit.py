@@ -182,6 +182,12 @@ class DefaultQubit(QubitDevice):
             "CZ": self._apply_cz,
             "Toffoli": self._apply_toffoli,
         }
+        self._apply_parametrized_ops = {
+            "SingleExcitation": self._apply_single_excitation,
+            "SingleExcitationMinus": self._apply_single_excitation_minus,
+            "SingleExcitationPlus": self._apply_single_excitation_plus,
+            "DoubleExcitation": self._apply_double_excitation,
+        }
 
     @functools.lru_cache()
     def map_wires(self, wires):
@@ -255,6 +261,12 @@ class DefaultQubit(QubitDevice):
             axes = self.wires.indices(wires)
             return self._apply_ops[operation.base_name](state, axes, inverse=operation.inverse)
 
+        if operation.base_name in self._apply_parametrized_ops:
+            axes = self.wires.indices(wires)
+            return self._apply_parametrized_ops[operation.base_name](
+                state, axes, operation.parameters[0], inverse=operation.inverse
+            )
+
         matrix = self._asarray(self._get_unitary_matrix(operation), dtype=self.C_DTYPE)
 
         if operation in diagonal_in_z_basis:
@@ -450,6 +462,170 @@ class DefaultQubit(QubitDevice):
         state_z = self._apply_z(state[sl_1], axes=target_axes)
         return self._stack([state[sl_0], state_z], axis=axes[0])
 
+    def _apply_single_excitation(self, state, axes, parameters, inverse=False):
+        r"""Applies a SingleExcitation gate by rotating the two amplitude slices with bit
+        patterns :math:`|01\rangle` and :math:`|10\rangle` on the target axes into each other.
+
+        This avoids building the dense :math:`4\times 4` matrix and the associated tensor
+        contraction over both axes; the remaining slices are passed through untouched.
+
+        Args:
+            state (array[complex]): input state
+            axes (List[int]): target axes to apply transformation
+            parameters (float): rotation angle :math:`\phi`
+            inverse (bool): whether to apply the inverse rotation
+
+        Returns:
+            array[complex]: output state
+        """
+        phi = -parameters if inverse else parameters
+        if qml.math.get_interface(phi) == "tensorflow":
+            phi = qml.math.cast_like(phi, 1j)
+        c = qml.math.cos(phi / 2)
+        s = qml.math.sin(phi / 2)
+        return self._apply_two_wire_givens(state, axes, c, s)
+
+    def _apply_single_excitation_minus(self, state, axes, parameters, inverse=False):
+        r"""Applies a SingleExcitationMinus gate like ``_apply_single_excitation``, but with
+        the additional phase :math:`e^{-i\phi/2}` applied to the untouched
+        :math:`|00\rangle`/:math:`|11\rangle` slices.
+
+        Args:
+            state (array[complex]): input state
+            axes (List[int]): target axes to apply transformation
+            parameters (float): rotation angle :math:`\phi`
+            inverse (bool): whether to apply the inverse rotation
+
+        Returns:
+            array[complex]: output state
+        """
+        phi = -parameters if inverse else parameters
+        if qml.math.get_interface(phi) == "tensorflow":
+            phi = qml.math.cast_like(phi, 1j)
+        c = qml.math.cos(phi / 2)
+        s = qml.math.sin(phi / 2)
+        e = qml.math.exp(-0.5j * phi)
+        return self._apply_two_wire_givens(state, axes, c, s, phase=e)
+
+    def _apply_single_excitation_plus(self, state, axes, parameters, inverse=False):
+        r"""Applies a SingleExcitationPlus gate like ``_apply_single_excitation``, but with
+        the additional phase :math:`e^{i\phi/2}` applied to the untouched
+        :math:`|00\rangle`/:math:`|11\rangle` slices.
+
+        Args:
+            state (array[complex]): input state
+            axes (List[int]): target axes to apply transformation
+            parameters (float): rotation angle :math:`\phi`
+            inverse (bool): whether to apply the inverse rotation
+
+        Returns:
+            array[complex]: output state
+        """
+        phi = -parameters if inverse else parameters
+        if qml.math.get_interface(phi) == "tensorflow":
+            phi = qml.math.cast_like(phi, 1j)
+        c = qml.math.cos(phi / 2)
+        s = qml.math.sin(phi / 2)
+        e = qml.math.exp(0.5j * phi)
+        return self._apply_two_wire_givens(state, axes, c, s, phase=e)
+
+    def _apply_two_wire_givens(self, state, axes, c, s, phase=None):
+        r"""Rotates the amplitude slices with bit patterns :math:`|01\rangle` and
+        :math:`|10\rangle` on the given axes into each other, optionally multiplying the
+        remaining :math:`|00\rangle`/:math:`|11\rangle` slices by a phase.
+
+        Args:
+            state (array[complex]): input state
+            axes (List[int]): target axes to apply transformation
+            c (tensor_like): cosine of half the rotation angle
+            s (tensor_like): sine of half the rotation angle
+            phase (tensor_like or None): optional phase applied outside the rotation subspace
+
+        Returns:
+            array[complex]: output state
+        """
+        num_wires = len(state.shape)
+        sl_0 = _get_slice(0, axes[0], num_wires)
+        sl_1 = _get_slice(1, axes[0], num_wires)
+
+        # After slicing along the first axis, the second axis loses one dimension if it
+        # comes after the first axis; see ``_apply_cnot`` for a detailed explanation.
+        target_axis = axes[1] - 1 if axes[1] > axes[0] else axes[1]
+        tsl_0 = _get_slice(0, target_axis, num_wires - 1)
+        tsl_1 = _get_slice(1, target_axis, num_wires - 1)
+
+        state_0 = state[sl_0]
+        state_1 = state[sl_1]
+        state_01 = c * state_0[tsl_1] - s * state_1[tsl_0]
+        state_10 = s * state_0[tsl_1] + c * state_1[tsl_0]
+
+        state_00 = state_0[tsl_0]
+        state_11 = state_1[tsl_1]
+        if phase is not None:
+            state_00 = phase * state_00
+            state_11 = phase * state_11
+
+        state_0 = self._stack([state_00, state_01], axis=target_axis)
+        state_1 = self._stack([state_10, state_11], axis=target_axis)
+        return self._stack([state_0, state_1], axis=axes[0])
+
+    def _apply_double_excitation(self, state, axes, parameters, inverse=False):
+        r"""Applies a DoubleExcitation gate by rotating the two amplitude slices with bit
+        patterns :math:`|0011\rangle` and :math:`|1100\rangle` on the target axes into
+        each other.
+
+        This avoids building the dense :math:`16\times 16` matrix and the associated
+        tensor contraction over all four axes; the remaining 14 slices are passed
+        through untouched.
+
+        Args:
+            state (array[complex]): input state
+            axes (List[int]): target axes to apply transformation
+            parameters (float): rotation angle :math:`\phi`
+            inverse (bool): whether to apply the inverse rotation
+
+        Returns:
+            array[complex]: output state
+        """
+        phi = -parameters if inverse else parameters
+        if qml.math.get_interface(phi) == "tensorflow":
+            phi = qml.math.cast_like(phi, 1j)
+        c = qml.math.cos(phi / 2)
+        s = qml.math.sin(phi / 2)
+
+        num_wires = len(state.shape)
+
+        # The two involved bit patterns are complementary, so they split at the very
+        # first axis. Slicing the largest axis first keeps the indices of the
+        # remaining axes valid after each slice; see ``_apply_cnot``.
+        pairs = sorted(zip(axes, (0, 0, 1, 1)), reverse=True)
+        first_axis, first_bit = pairs[0]
+        branch_0011 = state[_get_slice(first_bit, first_axis, num_wires)]
+        branch_1100 = state[_get_slice(1 - first_bit, first_axis, num_wires)]
+
+        # Descend into each branch, recording the sibling slices needed to
+        # reassemble the state afterwards.
+        siblings_0011 = []
+        siblings_1100 = []
+        n = num_wires - 1
+        for axis, bit in pairs[1:]:
+            siblings_0011.append((axis, bit, branch_0011[_get_slice(1 - bit, axis, n)]))
+            branch_0011 = branch_0011[_get_slice(bit, axis, n)]
+            siblings_1100.append((axis, 1 - bit, branch_1100[_get_slice(bit, axis, n)]))
+            branch_1100 = branch_1100[_get_slice(1 - bit, axis, n)]
+            n -= 1
+
+        new_0011 = c * branch_0011 - s * branch_1100
+        new_1100 = s * branch_0011 + c * branch_1100
+
+        for axis, bit, sibling in reversed(siblings_0011):
+            new_0011 = self._stack([sibling, new_0011] if bit else [new_0011, sibling], axis=axis)
+        for axis, bit, sibling in reversed(siblings_1100):
+            new_1100 = self._stack([sibling, new_1100] if bit else [new_1100, sibling], axis=axis)
+
+        branches = [new_1100, new_0011] if first_bit else [new_0011, new_1100]
+        return self._stack(branches, axis=first_axis)
+
     def _apply_phase(self, state, axes, parameters, inverse=False):
         """Applies a phase onto the 1 index along the axis specified in ``axes``.
 
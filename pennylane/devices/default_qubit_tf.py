@@ -167,6 +167,7 @@ class DefaultQubitTF(DefaultQubit):
         # limitations with TF slicing.
         if not SUPPORTS_APPLY_OPS or self.num_wires > 8:
             self._apply_ops = {}
+            self._apply_parametrized_ops = {}
 
     @classmethod
     def capabilities(cls):
@@ -14,16 +14,48 @@
 """
 This submodule applies the symbolic operation that indicates the adjoint of an operator through the `adjoint` transform.
 """
-from functools import wraps
+from functools import lru_cache, wraps
 
 from pennylane.operation import Operator, AdjointUndefinedError
+from pennylane.ops.qubit.attributes import self_inverses
 from pennylane.queuing import QueuingContext
 from pennylane.tape import QuantumTape, stop_recording
 
 from .adjoint_class import Adjoint
 
 
+def _single_op_lazy(op):
+    """Wrap ``op`` in an ``Adjoint``, collapsing a pre-existing wrapper since
+    the adjoint is an involution."""
+    if isinstance(op, Adjoint):
+        QueuingContext.append(op.base)
+        return op.base
+    return Adjoint(op)
+
+
 def _single_op_eager(op, update_queue=False):
+    if isinstance(op, Adjoint):
+        # The adjoint is an involution, so Adjoint(Adjoint(op)) is just op.
+        # Adjoint.adjoint() returns the existing base, so it has to be queued
+        # here rather than relying on constructor auto-queuing.
+        base = op.base
+        if update_queue:
+            QueuingContext.safe_update_info(op, owner=base)
+            QueuingContext.append(base, owns=op)
+        else:
+            QueuingContext.append(base)
+        return base
+    if op in self_inverses:
+        # The operator is its own adjoint; reuse it instead of allocating a
+        # copy. The op may have been captured on a discarded tape or defined
+        # outside any context, so (re-)queue it in the ambient context; for an
+        # op already in the queue this just refreshes its annotations.
+        QueuingContext.append(op)
+        return op
+    if type(op).adjoint is Operator.adjoint:
+        # The base-class method raises unconditionally; checking up front is
+        # much cheaper than raising and catching the exception.
+        return Adjoint(op)
     try:
         adj = op.adjoint()
         if update_queue:
@@ -31,6 +63,7 @@ def _single_op_eager(op, update_queue=False):
             QueuingContext.append(adj, owns=op)
         return adj
     except AdjointUndefinedError:
+        # overrides may still decline at runtime
         return Adjoint(op)
 
 
@@ -44,7 +77,9 @@ def adjoint(fn, lazy=True):
 
     Keyword Args:
         lazy=True (bool): If the transform is behaving lazily, all operations are wrapped in a ``Adjoint`` class
-            and handled later. If ``lazy=False``, operation-specific adjoint decompositions are first attempted.
+            and handled later, except that the adjoint of an ``Adjoint`` collapses to its base operator since
+            the adjoint is an involution. If ``lazy=False``, operation-specific adjoint decompositions are
+            first attempted.
 
     Returns:
         (function or :class:`~.operation.Operator`): If an Operator is provided, returns an Operator that is the adjoint.
@@ -113,6 +148,8 @@ def adjoint(fn, lazy=True):
 
     """
     if isinstance(fn, Operator):
+        if isinstance(fn, Adjoint):
+            return _single_op_eager(fn, update_queue=True)
         return Adjoint(fn) if lazy else _single_op_eager(fn, update_queue=True)
     if not callable(fn):
         raise ValueError(
@@ -121,16 +158,56 @@ def adjoint(fn, lazy=True):
             "of operations instead of a function or template."
         )
 
+    try:
+        # The wrapper is pure with respect to (fn, lazy), so repeated
+        # transforms of the same callable reuse one closure.
+        return _cached_make_wrapper(fn, lazy)
+    except TypeError:
+        # unhashable callables cannot be cached
+        return _make_wrapper(fn, lazy)
+
+
+def _make_wrapper(fn, lazy):
+    """Build the callable returned by :func:`adjoint` for a callable ``fn``."""
+    if isinstance(fn, type) and issubclass(fn, Operator):
+        # Fast path for a bare operator class: constructing the single operator
+        # directly avoids the tape-capture machinery of the generic wrapper.
+
+        @wraps(fn)
+        def class_wrapper(*args, **kwargs):
+            if QueuingContext.recording():
+                with stop_recording():
+                    op = fn(*args, **kwargs)
+            else:
+                # nothing to suppress outside of a queuing context
+                op = fn(*args, **kwargs)
+            return _single_op_lazy(op) if lazy else _single_op_eager(op)
+
+        return class_wrapper
+
     @wraps(fn)
     def wrapper(*args, **kwargs):
-        with stop_recording(), QuantumTape() as tape:
-            fn(*args, **kwargs)
-
-        if lazy:
-            adjoint_ops = [Adjoint(op) for op in reversed(tape.operations)]
+        if QueuingContext.recording():
+            with stop_recording(), QuantumTape() as tape:
+                fn(*args, **kwargs)
         else:
-            adjoint_ops = [_single_op_eager(op) for op in reversed(tape.operations)]
-
-        return adjoint_ops[0] if len(adjoint_ops) == 1 else adjoint_ops
+            # nothing to suppress outside of a queuing context
+            with QuantumTape() as tape:
+                fn(*args, **kwargs)
+
+        ops = tape.operations
+        if not ops:
+            return []
+        if len(ops) == 1:
+            return _single_op_lazy(ops[0]) if lazy else _single_op_eager(ops[0])
+
+        # map() binds the emit function once instead of re-resolving it on
+        # every iteration and runs the loop in C.
+        if lazy:
+            return list(map(_single_op_lazy, reversed(ops)))
+        return list(map(_single_op_eager, reversed(ops)))
 
     return wrapper
+
+
+_cached_make_wrapper = lru_cache(maxsize=1024)(_make_wrapper)
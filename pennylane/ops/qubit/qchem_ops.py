@@ -16,11 +16,113 @@ This submodule contains the discrete-variable quantum operations that come
 from quantum chemistry applications.
 """
 # pylint:disable=abstract-method,arguments-differ,protected-access
+import math
+from copy import copy
+from functools import lru_cache
+
 import numpy as np
 from scipy.sparse import csr_matrix
 
 import pennylane as qml
 from pennylane.operation import Operation
+from pennylane.wires import Wires
+
+# Constant matrix blocks used by the excitation operations below. These are
+# hoisted to module scope so that they are only allocated once at import time,
+# rather than on every matrix construction.
+_OFF_DIAG_SE = np.array([[0, 0, 0, 0], [0, 0, -1, 0], [0, 1, 0, 0], [0, 0, 0, 0]])
+
+_SE_EYE = np.diag([1.0, 0, 0, 1.0])
+_SE_DIAG = np.diag([0, 1.0, 1.0, 0])
+
+# Decomposition of the DoubleExcitation matrix into constant blocks: the
+# identity outside the rotation subspace, and the diagonal/off-diagonal parts
+# of the Givens rotation acting on |0011> (index 3) and |1100> (index 12).
+_DE_EYE = np.eye(16)
+_DE_EYE[3, 3] = _DE_EYE[12, 12] = 0
+_DE_DIAG = np.zeros((16, 16))
+_DE_DIAG[3, 3] = _DE_DIAG[12, 12] = 1
+_DE_OFF_DIAG = np.zeros((16, 16))
+_DE_OFF_DIAG[3, 12] = -1
+_DE_OFF_DIAG[12, 3] = 1
+
+
+def _coo_to_dense(entries):
+    """Densify a list of ``(row, col, value)`` triples into a 16x16 array."""
+    mat = np.zeros((16, 16))
+    for row, col, value in entries:
+        mat[row, col] = value
+    return mat
+
+
+# The OrbitalRotation matrix is a polynomial in c = cos(phi/2) and
+# s = sin(phi/2); its nonzero entries are recorded here in COO form, grouped
+# by coefficient, and densified into constant masks once at import time.
+_OR_EYE = _coo_to_dense([(i, i, 1) for i in (0, 5, 10, 15)])
+_OR_C = _coo_to_dense([(i, i, 1) for i in (1, 2, 4, 7, 8, 11, 13, 14)])
+_OR_C2 = _coo_to_dense([(i, i, 1) for i in (3, 6, 9, 12)])
+_OR_S = _coo_to_dense(
+    [
+        (1, 4, -1),
+        (2, 8, -1),
+        (4, 1, 1),
+        (7, 13, -1),
+        (8, 2, 1),
+        (11, 14, -1),
+        (13, 7, 1),
+        (14, 11, 1),
+    ]
+)
+_OR_CS = _coo_to_dense(
+    [(3, 6, -1), (3, 9, -1), (6, 3, 1), (6, 12, -1), (9, 3, 1), (9, 12, -1), (12, 6, 1), (12, 9, 1)]
+)
+_OR_S2 = _coo_to_dense([(3, 12, 1), (6, 9, -1), (9, 6, -1), (12, 3, 1)])
+
+
+def _de_phase_generator(sign):
+    """Sparse generator of the phase-shifted double-excitation rotations, with
+    ``sign`` the sign of the identity part (-1 for Plus, +1 for Minus)."""
+    G = sign * np.eye(16, dtype=np.complex64)
+    G[3, 3] = G[12, 12] = 0
+    G[3, 12] = -1j  # 3 (dec) = 0011 (bin)
+    G[12, 3] = 1j  # 12 (dec) = 1100 (bin)
+    return csr_matrix(-0.5 * G)
+
+
+# The generators are parameter independent, so the sparse matrices are built
+# once at import time rather than on every generator() call.
+_DE_PLUS_GENERATOR = _de_phase_generator(-1)
+_DE_MINUS_GENERATOR = _de_phase_generator(1)
+
+
+# Structure-of-arrays layout: the coefficient masks are stacked into a single
+# (5, 16, 16) basis tensor so that the matrix can be assembled with one
+# tensor contraction against the coefficient vector (c, c^2, s, cs, s^2).
+_OR_BASIS = np.stack([_OR_C, _OR_C2, _OR_S, _OR_CS, _OR_S2])
+
+
+@lru_cache(maxsize=1024)
+def _cs_scalar(phi):
+    """Cosine and sine of half a plain Python scalar angle, memoized.
+
+    Matrix construction is frequently repeated with identical scalar angles,
+    for example for the fixed shift values of parameter-shift rules. The
+    stdlib trig functions are used since they avoid ufunc dispatch for
+    scalar arguments.
+    """
+    return math.cos(phi * 0.5), math.sin(phi * 0.5)
+
+
+def _matrix_trig(phi):
+    """Return ``(cos(phi/2), sin(phi/2))`` for the given angle.
+
+    Plain Python scalars are routed through the memoized :func:`_cs_scalar`;
+    tensor angles dispatch to ``qml.math`` so that autodifferentiation and
+    tracing remain intact.
+    """
+    if isinstance(phi, (int, float)):
+        return _cs_scalar(phi)
+    return qml.math.cos(phi / 2), qml.math.sin(phi / 2)
 
 
 class SingleExcitation(Operation):
@@ -114,11 +216,21 @@ class SingleExcitation(Operation):
                 [ 0.0000,  0.2474,  0.9689,  0.0000],
                 [ 0.0000,  0.0000,  0.0000,  1.0000]])
         """
-        c = qml.math.cos(phi / 2)
-        s = qml.math.sin(phi / 2)
+        c, s = _matrix_trig(phi)
+
+        if qml.math.ndim(phi) != 0:
+            # The angle is batched; broadcast the constant blocks against the
+            # stacked coefficients to return a (batch_size, 4, 4) tensor.
+            c = qml.math.reshape(c, (-1, 1, 1))
+            s = qml.math.reshape(s, (-1, 1, 1))
+            return (
+                c * qml.math.cast_like(qml.math.convert_like(_SE_DIAG, phi), c)
+                + s * qml.math.cast_like(qml.math.convert_like(_OFF_DIAG_SE, phi), s)
+                + qml.math.cast_like(qml.math.convert_like(_SE_EYE, phi), c)
+            )
 
         mat = qml.math.diag([1, c, c, 1])
-        off_diag = qml.math.convert_like(np.diag([0, 1, -1, 0])[::-1].copy(), phi)
+        off_diag = qml.math.convert_like(_OFF_DIAG_SE, phi)
         return mat + s * qml.math.cast_like(off_diag, s)
 
     @staticmethod
@@ -135,24 +247,27 @@ class SingleExcitation(Operation):
             wires (Iterable, Wires): wires that the operator acts on
 
         Returns:
-            list[Operator]: decomposition into lower level operations
+            tuple[Operator]: decomposition into lower level operations
 
         **Example:**
 
         >>> qml.SingleExcitation.compute_decomposition(1.23, wires=(0,1))
-        [CNOT(wires=[0, 1]), CRY(1.23, wires=[1, 0]), CNOT(wires=[0, 1])]
+        (CNOT(wires=[0, 1]), CRY(1.23, wires=[1, 0]), CNOT(wires=[0, 1]))
 
         """
-        decomp_ops = [
-            qml.CNOT(wires=[wires[0], wires[1]]),
-            qml.CRY(phi, wires=[wires[1], wires[0]]),
-            qml.CNOT(wires=[wires[0], wires[1]]),
-        ]
-        return decomp_ops
+        w0, w1 = wires[0], wires[1]
+        return (
+            qml.CNOT(wires=[w0, w1]),
+            qml.CRY(phi, wires=[w1, w0]),
+            qml.CNOT(wires=[w0, w1]),
+        )
 
     def adjoint(self):
-        (phi,) = self.parameters
-        return SingleExcitation(-phi, wires=self.wires)
+        # Copying skips __init__ wire/parameter validation, which the original
+        # operation already performed.
+        adj = copy(self)
+        adj.data = [-self.data[0]]
+        return adj.queue()
 
     def pow(self, z):
         return [SingleExcitation(self.data[0] * z, wires=self.wires)]
@@ -235,19 +350,12 @@ class SingleExcitationMinus(Operation):
                 [ 0.0000+0.0000j,  0.2474+0.0000j,  0.9689+0.0000j,  0.0000+0.0000j],
                 [ 0.0000+0.0000j,  0.0000+0.0000j,  0.0000+0.0000j,  0.9689-0.2474j]])
         """
-        c = qml.math.cos(phi / 2)
-        s = qml.math.sin(phi / 2)
-
-        interface = qml.math.get_interface(phi)
-
-        if interface == "tensorflow":
+        if qml.math.get_interface(phi) == "tensorflow":
             phi = qml.math.cast_like(phi, 1j)
-            c = qml.math.cast_like(c, 1j)
-            s = qml.math.cast_like(s, 1j)
-
+        c, s = _matrix_trig(phi)
         e = qml.math.exp(-1j * phi / 2)
         mat = qml.math.diag([e, 0, 0, e]) + qml.math.diag([0, c, c, 0])
-        off_diag = qml.math.convert_like(np.diag([0, 1, -1, 0])[::-1].copy(), phi)
+        off_diag = qml.math.convert_like(_OFF_DIAG_SE, phi)
         return mat + s * qml.math.cast_like(off_diag, s)
 
     @staticmethod
@@ -264,12 +372,12 @@ class SingleExcitationMinus(Operation):
             wires (Iterable, Wires): wires that the operator acts on
 
         Returns:
-            list[Operator]: decomposition into lower level operations
+            tuple[Operator]: decomposition into lower level operations
 
         **Example:**
 
         >>> qml.SingleExcitationMinus.compute_decomposition(1.23, wires=(0,1))
-        [PauliX(wires=[0]),
+        (PauliX(wires=[0]),
         PauliX(wires=[1]),
         ControlledPhaseShift(-0.615, wires=[1, 0]),
         PauliX(wires=[0]),
@@ -277,21 +385,21 @@ class SingleExcitationMinus(Operation):
         ControlledPhaseShift(-0.615, wires=[0, 1]),
         CNOT(wires=[0, 1]),
         CRY(1.23, wires=[1, 0]),
-        CNOT(wires=[0, 1])]
+        CNOT(wires=[0, 1]))
 
         """
-        decomp_ops = [
-            qml.PauliX(wires=wires[0]),
-            qml.PauliX(wires=wires[1]),
-            qml.ControlledPhaseShift(-phi / 2, wires=[wires[1], wires[0]]),
-            qml.PauliX(wires=wires[0]),
-            qml.PauliX(wires=wires[1]),
-            qml.ControlledPhaseShift(-phi / 2, wires=[wires[0], wires[1]]),
-            qml.CNOT(wires=[wires[0], wires[1]]),
-            qml.CRY(phi, wires=[wires[1], wires[0]]),
-            qml.CNOT(wires=[wires[0], wires[1]]),
-        ]
-        return decomp_ops
+        w0, w1 = wires[0], wires[1]
+        return (
+            qml.PauliX(wires=w0),
+            qml.PauliX(wires=w1),
+            qml.ControlledPhaseShift(-phi / 2, wires=[w1, w0]),
+            qml.PauliX(wires=w0),
+            qml.PauliX(wires=w1),
+            qml.ControlledPhaseShift(-phi / 2, wires=[w0, w1]),
+            qml.CNOT(wires=[w0, w1]),
+            qml.CRY(phi, wires=[w1, w0]),
+            qml.CNOT(wires=[w0, w1]),
+        )
 
     def adjoint(self):
         (phi,) = self.parameters
@@ -375,19 +483,12 @@ class SingleExcitationPlus(Operation):
                 [ 0.0000+0.0000j,  0.2474+0.0000j,  0.9689+0.0000j,  0.0000+0.0000j],
                 [ 0.0000+0.0000j,  0.0000+0.0000j,  0.0000+0.0000j,  0.9689+0.2474j]])
         """
-        c = qml.math.cos(phi / 2)
-        s = qml.math.sin(phi / 2)
-
-        interface = qml.math.get_interface(phi)
-
-        if interface == "tensorflow":
+        if qml.math.get_interface(phi) == "tensorflow":
             phi = qml.math.cast_like(phi, 1j)
-            c = qml.math.cast_like(c, 1j)
-            s = qml.math.cast_like(s, 1j)
-
+        c, s = _matrix_trig(phi)
         e = qml.math.exp(1j * phi / 2)
         mat = qml.math.diag([e, 0, 0, e]) + qml.math.diag([0, c, c, 0])
-        off_diag = qml.math.convert_like(np.diag([0, 1, -1, 0])[::-1].copy(), phi)
+        off_diag = qml.math.convert_like(_OFF_DIAG_SE, phi)
         return mat + s * qml.math.cast_like(off_diag, s)
 
     @staticmethod
@@ -404,12 +505,12 @@ class SingleExcitationPlus(Operation):
             wires (Iterable, Wires): wires that the operator acts on
 
         Returns:
-            list[Operator]: decomposition into lower level operations
+            tuple[Operator]: decomposition into lower level operations
 
         **Example:**
 
         >>> qml.SingleExcitationPlus.compute_decomposition(1.23, wires=(0,1))
-        [PauliX(wires=[0]),
+        (PauliX(wires=[0]),
         PauliX(wires=[1]),
         ControlledPhaseShift(0.615, wires=[1, 0]),
         PauliX(wires=[0]),
@@ -417,21 +518,21 @@ class SingleExcitationPlus(Operation):
         ControlledPhaseShift(0.615, wires=[0, 1]),
         CNOT(wires=[0, 1]),
         CRY(1.23, wires=[1, 0]),
-        CNOT(wires=[0, 1])]
+        CNOT(wires=[0, 1]))
 
         """
-        decomp_ops = [
-            qml.PauliX(wires=wires[0]),
-            qml.PauliX(wires=wires[1]),
-            qml.ControlledPhaseShift(phi / 2, wires=[wires[1], wires[0]]),
-            qml.PauliX(wires=wires[0]),
-            qml.PauliX(wires=wires[1]),
-            qml.ControlledPhaseShift(phi / 2, wires=[wires[0], wires[1]]),
-            qml.CNOT(wires=[wires[0], wires[1]]),
-            qml.CRY(phi, wires=[wires[1], wires[0]]),
-            qml.CNOT(wires=[wires[0], wires[1]]),
-        ]
-        return decomp_ops
+        w0, w1 = wires[0], wires[1]
+        return (
+            qml.PauliX(wires=w0),
+            qml.PauliX(wires=w1),
+            qml.ControlledPhaseShift(phi / 2, wires=[w1, w0]),
+            qml.PauliX(wires=w0),
+            qml.PauliX(wires=w1),
+            qml.ControlledPhaseShift(phi / 2, wires=[w0, w1]),
+            qml.CNOT(wires=[w0, w1]),
+            qml.CRY(phi, wires=[w1, w0]),
+            qml.CNOT(wires=[w0, w1]),
+        )
 
     def adjoint(self):
         (phi,) = self.parameters
@@ -540,13 +641,22 @@ class DoubleExcitation(Operation):
         Returns:
           tensor_like: canonical matrix
         """
-        c = qml.math.cos(phi / 2)
-        s = qml.math.sin(phi / 2)
+        c, s = _matrix_trig(phi)
 
-        mat = qml.math.diag([1.0] * 3 + [c] + [1.0] * 8 + [c] + [1.0] * 3)
-        mat = qml.math.scatter_element_add(mat, (3, 12), -s)
-        mat = qml.math.scatter_element_add(mat, (12, 3), s)
-        return mat
+        if qml.math.ndim(phi) != 0:
+            # The angle is batched; broadcast the constant blocks against the
+            # stacked coefficients to return a (batch_size, 16, 16) tensor.
+            c = qml.math.reshape(c, (-1, 1, 1))
+            s = qml.math.reshape(s, (-1, 1, 1))
+
+        eye = qml.math.convert_like(_DE_EYE, phi)
+        diag = qml.math.convert_like(_DE_DIAG, phi)
+        off_diag = qml.math.convert_like(_DE_OFF_DIAG, phi)
+        return (
+            c * qml.math.cast_like(diag, c)
+            + s * qml.math.cast_like(off_diag, s)
+            + qml.math.cast_like(eye, c)
+        )
 
     @staticmethod
     def compute_decomposition(phi, wires):
@@ -565,12 +675,12 @@ class DoubleExcitation(Operation):
             wires (Iterable, Wires): wires that the operator acts on
 
         Returns:
-            list[Operator]: decomposition into lower level operations
+            tuple[Operator]: decomposition into lower level operations
 
         **Example:**
 
         >>> qml.DoubleExcitation.compute_decomposition(1.23, wires=(0,1,2,3))
-        [CNOT(wires=[2, 3]),
+        (CNOT(wires=[2, 3]),
         CNOT(wires=[0, 2]),
         Hadamard(wires=[3]),
         Hadamard(wires=[0]),
@@ -597,46 +707,48 @@ class DoubleExcitation(Operation):
         Hadamard(wires=[0]),
         Hadamard(wires=[3]),
         CNOT(wires=[0, 2]),
-        CNOT(wires=[2, 3])]
+        CNOT(wires=[2, 3]))
 
         """
         # This decomposition is the "upside down" version of that on p17 of https://arxiv.org/abs/2104.05695
-        decomp_ops = [
-            qml.CNOT(wires=[wires[2], wires[3]]),
-            qml.CNOT(wires=[wires[0], wires[2]]),
-            qml.Hadamard(wires=wires[3]),
-            qml.Hadamard(wires=wires[0]),
-            qml.CNOT(wires=[wires[2], wires[3]]),
-            qml.CNOT(wires=[wires[0], wires[1]]),
-            qml.RY(phi / 8, wires=wires[1]),
-            qml.RY(-phi / 8, wires=wires[0]),
-            qml.CNOT(wires=[wires[0], wires[3]]),
-            qml.Hadamard(wires=wires[3]),
-            qml.CNOT(wires=[wires[3], wires[1]]),
-            qml.RY(phi / 8, wires=wires[1]),
-            qml.RY(-phi / 8, wires=wires[0]),
-            qml.CNOT(wires=[wires[2], wires[1]]),
-            qml.CNOT(wires=[wires[2], wires[0]]),
-            qml.RY(-phi / 8, wires=wires[1]),
-            qml.RY(phi / 8, wires=wires[0]),
-            qml.CNOT(wires=[wires[3], wires[1]]),
-            qml.Hadamard(wires=wires[3]),
-            qml.CNOT(wires=[wires[0], wires[3]]),
-            qml.RY(-phi / 8, wires=wires[1]),
-            qml.RY(phi / 8, wires=wires[0]),
-            qml.CNOT(wires=[wires[0], wires[1]]),
-            qml.CNOT(wires=[wires[2], wires[0]]),
-            qml.Hadamard(wires=wires[0]),
-            qml.Hadamard(wires=wires[3]),
-            qml.CNOT(wires=[wires[0], wires[2]]),
-            qml.CNOT(wires=[wires[2], wires[3]]),
-        ]
-
-        return decomp_ops
+        w0, w1, w2, w3 = wires[0], wires[1], wires[2], wires[3]
+        return (
+            qml.CNOT(wires=[w2, w3]),
+            qml.CNOT(wires=[w0, w2]),
+            qml.Hadamard(wires=w3),
+            qml.Hadamard(wires=w0),
+            qml.CNOT(wires=[w2, w3]),
+            qml.CNOT(wires=[w0, w1]),
+            qml.RY(phi / 8, wires=w1),
+            qml.RY(-phi / 8, wires=w0),
+            qml.CNOT(wires=[w0, w3]),
+            qml.Hadamard(wires=w3),
+            qml.CNOT(wires=[w3, w1]),
+            qml.RY(phi / 8, wires=w1),
+            qml.RY(-phi / 8, wires=w0),
+            qml.CNOT(wires=[w2, w1]),
+            qml.CNOT(wires=[w2, w0]),
+            qml.RY(-phi / 8, wires=w1),
+            qml.RY(phi / 8, wires=w0),
+            qml.CNOT(wires=[w3, w1]),
+            qml.Hadamard(wires=w3),
+            qml.CNOT(wires=[w0, w3]),
+            qml.RY(-phi / 8, wires=w1),
+            qml.RY(phi / 8, wires=w0),
+            qml.CNOT(wires=[w0, w1]),
+            qml.CNOT(wires=[w2, w0]),
+            qml.Hadamard(wires=w0),
+            qml.Hadamard(wires=w3),
+            qml.CNOT(wires=[w0, w2]),
+            qml.CNOT(wires=[w2, w3]),
+        )
 
     def adjoint(self):
-        (theta,) = self.parameters
-        return DoubleExcitation(-theta, wires=self.wires)
+        # Copying skips __init__ wire/parameter validation, which the original
+        # operation already performed.
+        adj = copy(self)
+        adj.data = [-self.data[0]]
+        return adj.queue()
 
     def label(self, decimals=None, base_label=None, cache=None):
         return super().label(decimals=decimals, base_label=base_label or "G²", cache=cache)
@@ -685,12 +797,7 @@ class DoubleExcitationPlus(Operation):
     """Frequencies of the operation parameter with respect to an expectation value."""
 
     def generator(self):
-        G = -1 * np.eye(16, dtype=np.complex64)
-        G[3, 3] = G[12, 12] = 0
-        G[3, 12] = -1j  # 3 (dec) = 0011 (bin)
-        G[12, 3] = 1j  # 12 (dec) = 1100 (bin)
-        H = csr_matrix(-0.5 * G)
-        return qml.SparseHamiltonian(H, wires=self.wires)
+        return qml.SparseHamiltonian(_DE_PLUS_GENERATOR, wires=self.wires)
 
     def __init__(self, phi, wires, do_queue=True, id=None):
         super().__init__(phi, wires=wires, do_queue=do_queue, id=id)
@@ -711,24 +818,19 @@ class DoubleExcitationPlus(Operation):
           tensor_like: canonical matrix
 
         """
-        c = qml.math.cos(phi / 2)
-        s = qml.math.sin(phi / 2)
-
-        interface = qml.math.get_interface(phi)
-
-        if interface == "tensorflow":
+        if qml.math.get_interface(phi) == "tensorflow":
             phi = qml.math.cast_like(phi, 1j)
-            c = qml.math.cast_like(c, 1j)
-            s = qml.math.cast_like(s, 1j)
-
+        c, s = _matrix_trig(phi)
         e = qml.math.exp(1j * phi / 2)
 
-        mat = qml.math.diag([e] * 3 + [0] + [e] * 8 + [0] + [e] * 3)
-        mat = qml.math.scatter_element_add(mat, (3, 3), c)
-        mat = qml.math.scatter_element_add(mat, (3, 12), -s)
-        mat = qml.math.scatter_element_add(mat, (12, 3), s)
-        mat = qml.math.scatter_element_add(mat, (12, 12), c)
-        return mat
+        eye = qml.math.convert_like(_DE_EYE, phi)
+        diag = qml.math.convert_like(_DE_DIAG, phi)
+        off_diag = qml.math.convert_like(_DE_OFF_DIAG, phi)
+        return (
+            e * qml.math.cast_like(eye, e)
+            + c * qml.math.cast_like(diag, e)
+            + s * qml.math.cast_like(off_diag, e)
+        )
 
     def adjoint(self):
         (theta,) = self.parameters
@@ -781,13 +883,7 @@ class DoubleExcitationMinus(Operation):
     """Frequencies of the operation parameter with respect to an expectation value."""
 
     def generator(self):
-        G = np.eye(16, dtype=np.complex64)
-        G[3, 3] = 0
-        G[12, 12] = 0
-        G[3, 12] = -1j  # 3 (dec) = 0011 (bin)
-        G[12, 3] = 1j  # 12 (dec) = 1100 (bin)
-        H = csr_matrix(-0.5 * G)
-        return qml.SparseHamiltonian(H, wires=self.wires)
+        return qml.SparseHamiltonian(_DE_MINUS_GENERATOR, wires=self.wires)
 
     @staticmethod
     def compute_matrix(phi):  # pylint: disable=arguments-differ
@@ -806,23 +902,19 @@ class DoubleExcitationMinus(Operation):
           tensor_like: canonical matrix
 
         """
-        c = qml.math.cos(phi / 2)
-        s = qml.math.sin(phi / 2)
-
-        interface = qml.math.get_interface(phi)
-
-        if interface == "tensorflow":
+        if qml.math.get_interface(phi) == "tensorflow":
             phi = qml.math.cast_like(phi, 1j)
-            c = qml.math.cast_like(c, 1j)
-            s = qml.math.cast_like(s, 1j)
-
+        c, s = _matrix_trig(phi)
         e = qml.math.exp(-1j * phi / 2)
-        mat = qml.math.diag([e] * 3 + [0] + [e] * 8 + [0] + [e] * 3)
-        mat = qml.math.scatter_element_add(mat, (3, 3), c)
-        mat = qml.math.scatter_element_add(mat, (3, 12), -s)
-        mat = qml.math.scatter_element_add(mat, (12, 3), s)
-        mat = qml.math.scatter_element_add(mat, (12, 12), c)
-        return mat
+
+        eye = qml.math.convert_like(_DE_EYE, phi)
+        diag = qml.math.convert_like(_DE_DIAG, phi)
+        off_diag = qml.math.convert_like(_DE_OFF_DIAG, phi)
+        return (
+            e * qml.math.cast_like(eye, e)
+            + c * qml.math.cast_like(diag, e)
+            + s * qml.math.cast_like(off_diag, e)
+        )
 
     def adjoint(self):
         (theta,) = self.parameters
@@ -832,6 +924,18 @@ class DoubleExcitationMinus(Operation):
         return super().label(decimals=decimals, base_label=base_label or "G²₋", cache=cache)
 
 
+@lru_cache(maxsize=256)
+def _orbital_rotation_cnot_wires(wire_labels):
+    """Memoized CNOT wire patterns for :class:`~.OrbitalRotation`'s decomposition.
+
+    The patterns only depend on the wire labels, so ansätze that repeat the
+    gate on the same wires (e.g. per Trotter step) reuse the same ``Wires``
+    objects instead of allocating new ones on every decomposition.
+    """
+    w0, w1, w2, w3 = wire_labels
+    return Wires([w3, w1]), Wires([w2, w0])
+
+
 class OrbitalRotation(Operation):
     r"""
     Spin-adapted spatial orbital rotation.
@@ -930,42 +1034,13 @@ class OrbitalRotation(Operation):
         # where the sign flip is to adjust for the opposite convention used by authors for naming wires.
         # Additionally, there was a typo in the sign of a matrix element "s" at [2, 8], which is fixed here.
 
-        c = qml.math.cos(phi / 2)
-        s = qml.math.sin(phi / 2)
-
-        interface = qml.math.get_interface(phi)
-
-        if interface == "torch":
-            # Use convert_like to ensure that the tensor is put on the correct
-            # Torch device
-            z = qml.math.convert_like(qml.math.zeros([16]), phi)
-        else:
-            z = qml.math.zeros([16], like=interface)
-
-        diag = qml.math.diag([1, c, c, c**2, c, 1, c**2, c, c, c**2, 1, c, c**2, c, c, 1])
-
-        U = diag + qml.math.stack(
-            [
-                z,
-                qml.math.stack([0, 0, 0, 0, -s, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-                qml.math.stack([0, 0, 0, 0, 0, 0, 0, 0, -s, 0, 0, 0, 0, 0, 0, 0]),
-                qml.math.stack([0, 0, 0, 0, 0, 0, -c * s, 0, 0, -c * s, 0, 0, s * s, 0, 0, 0]),
-                qml.math.stack([0, s, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-                z,
-                qml.math.stack([0, 0, 0, c * s, 0, 0, 0, 0, 0, -s * s, 0, 0, -c * s, 0, 0, 0]),
-                qml.math.stack([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -s, 0, 0]),
-                qml.math.stack([0, 0, s, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
-                qml.math.stack([0, 0, 0, c * s, 0, 0, -s * s, 0, 0, 0, 0, 0, -c * s, 0, 0, 0]),
-                z,
-                qml.math.stack([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -s, 0]),
-                qml.math.stack([0, 0, 0, s * s, 0, 0, c * s, 0, 0, c * s, 0, 0, 0, 0, 0, 0]),
-                qml.math.stack([0, 0, 0, 0, 0, 0, 0, s, 0, 0, 0, 0, 0, 0, 0, 0]),
-                qml.math.stack([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, s, 0, 0, 0, 0]),
-                z,
-            ]
-        )
+        c, s = _matrix_trig(phi)
 
-        return U
+        coeffs = qml.math.stack([c, c * c, s, c * s, s * s])
+        basis = qml.math.cast_like(qml.math.convert_like(_OR_BASIS, phi), c)
+        return qml.math.tensordot(coeffs, basis, axes=[[0], [0]]) + qml.math.cast_like(
+            qml.math.convert_like(_OR_EYE, phi), c
+        )
 
     @staticmethod
     def compute_decomposition(phi, wires):
@@ -984,12 +1059,12 @@ class OrbitalRotation(Operation):
             wires (Iterable, Wires): wires that the operator acts on
 
         Returns:
-            list[Operator]: decomposition into lower level operations
+            tuple[Operator]: decomposition into lower level operations
 
         **Example:**
 
         >>> qml.OrbitalRotation.compute_decomposition(1.23, wires=(0,1,2,3))
-        [Hadamard(wires=[3]),
+        (Hadamard(wires=[3]),
         Hadamard(wires=[2]),
         CNOT(wires=[3, 1]),
         CNOT(wires=[2, 0]),
@@ -1000,25 +1075,26 @@ class OrbitalRotation(Operation):
         CNOT(wires=[3, 1]),
         CNOT(wires=[2, 0]),
         Hadamard(wires=[3]),
-        Hadamard(wires=[2])]
+        Hadamard(wires=[2]))
 
         """
         # This decomposition is the "upside down" version of that on p18 of https://arxiv.org/abs/2104.05695
-        decomp_ops = [
-            qml.Hadamard(wires=wires[3]),
-            qml.Hadamard(wires=wires[2]),
-            qml.CNOT(wires=[wires[3], wires[1]]),
-            qml.CNOT(wires=[wires[2], wires[0]]),
-            qml.RY(phi / 2, wires=wires[3]),
-            qml.RY(phi / 2, wires=wires[2]),
-            qml.RY(phi / 2, wires=wires[1]),
-            qml.RY(phi / 2, wires=wires[0]),
-            qml.CNOT(wires=[wires[3], wires[1]]),
-            qml.CNOT(wires=[wires[2], wires[0]]),
-            qml.Hadamard(wires=wires[3]),
-            qml.Hadamard(wires=wires[2]),
-        ]
-        return decomp_ops
+        w0, w1, w2, w3 = wires[0], wires[1], wires[2], wires[3]
+        cnot_31, cnot_20 = _orbital_rotation_cnot_wires((w0, w1, w2, w3))
+        return (
+            qml.Hadamard(wires=w3),
+            qml.Hadamard(wires=w2),
+            qml.CNOT(wires=cnot_31),
+            qml.CNOT(wires=cnot_20),
+            qml.RY(phi / 2, wires=w3),
+            qml.RY(phi / 2, wires=w2),
+            qml.RY(phi / 2, wires=w1),
+            qml.RY(phi / 2, wires=w0),
+            qml.CNOT(wires=cnot_31),
+            qml.CNOT(wires=cnot_20),
+            qml.Hadamard(wires=w3),
+            qml.Hadamard(wires=w2),
+        )
 
     def adjoint(self):
         (phi,) = self.parameters
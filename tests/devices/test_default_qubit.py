@@ -2166,6 +2166,11 @@ class TestApplyOps:
     three_qubit_ops = [
         (qml.Toffoli, dev._apply_toffoli),
     ]
+    single_excitation_ops = [
+        (qml.SingleExcitation, dev._apply_single_excitation),
+        (qml.SingleExcitationMinus, dev._apply_single_excitation_minus),
+        (qml.SingleExcitationPlus, dev._apply_single_excitation_plus),
+    ]
 
     @pytest.mark.parametrize("op, method", single_qubit_ops)
     def test_apply_single_qubit_op(self, op, method, inverse):
@@ -2230,6 +2235,54 @@ class TestApplyOps:
         state_out_einsum = np.einsum("abcdef,kdfe->kacb", matrix, self.state)
         assert np.allclose(state_out, state_out_einsum)
 
+    @pytest.mark.parametrize("op, method", single_excitation_ops)
+    @pytest.mark.parametrize("phi", [0.123, np.pi / 4])
+    def test_apply_single_excitation(self, op, method, inverse, phi):
+        """Test if the fused application of single-excitation operations is correct."""
+        state_out = method(self.state, axes=[1, 3], parameters=phi, inverse=inverse)
+        op = op(phi, wires=[1, 3])
+        matrix = op.inv().matrix() if inverse else op.matrix()
+        matrix = matrix.reshape((2, 2, 2, 2))
+        state_out_einsum = np.einsum("abcd,icjd->iajb", matrix, self.state)
+        assert np.allclose(state_out, state_out_einsum)
+
+    @pytest.mark.parametrize("op, method", single_excitation_ops)
+    @pytest.mark.parametrize("phi", [0.123, np.pi / 4])
+    def test_apply_single_excitation_reverse(self, op, method, inverse, phi):
+        """Test if the fused application of single-excitation operations is correct when the
+        applied wires are reversed."""
+        state_out = method(self.state, axes=[3, 1], parameters=phi, inverse=inverse)
+        op = op(phi, wires=[3, 1])
+        matrix = op.inv().matrix() if inverse else op.matrix()
+        matrix = matrix.reshape((2, 2, 2, 2))
+        state_out_einsum = np.einsum("abcd,idjc->ibja", matrix, self.state)
+        assert np.allclose(state_out, state_out_einsum)
+
+    @pytest.mark.parametrize("phi", [0.123, np.pi / 4])
+    def test_apply_double_excitation(self, inverse, phi):
+        """Test if the fused application of the DoubleExcitation operation is correct."""
+        state_out = self.dev._apply_double_excitation(
+            self.state, axes=[0, 1, 2, 3], parameters=phi, inverse=inverse
+        )
+        op = qml.DoubleExcitation(phi, wires=[0, 1, 2, 3])
+        matrix = op.inv().matrix() if inverse else op.matrix()
+        matrix = matrix.reshape((2, 2) * 4)
+        state_out_einsum = np.einsum("abcdefgh,efgh->abcd", matrix, self.state)
+        assert np.allclose(state_out, state_out_einsum)
+
+    @pytest.mark.parametrize("phi", [0.123, np.pi / 4])
+    def test_apply_double_excitation_permuted(self, inverse, phi):
+        """Test if the fused application of the DoubleExcitation operation is correct when
+        the applied wires are permuted."""
+        state_out = self.dev._apply_double_excitation(
+            self.state, axes=[2, 0, 3, 1], parameters=phi, inverse=inverse
+        )
+        op = qml.DoubleExcitation(phi, wires=[2, 0, 3, 1])
+        matrix = op.inv().matrix() if inverse else op.matrix()
+        matrix = matrix.reshape((2, 2) * 4)
+        state_out_einsum = np.einsum("abcdefgh,fheg->bdac", matrix, self.state)
+        assert np.allclose(state_out, state_out_einsum)
+
 
 class TestStateVector:
     """Unit tests for the _apply_state_vector method"""
@@ -135,18 +135,30 @@ class TestDifferentCallableTypes:
         assert tape[2].data == [x]
 
     def test_nested_adjoint(self):
-        """Test the adjoint transform on an adjoint transform."""
+        """Test that a nested adjoint transform collapses to the base operator,
+        since the adjoint is an involution."""
         x = 4.321
         with qml.tape.QuantumTape() as tape:
             out = adjoint(adjoint(qml.RX))(x, wires="b")
 
         assert out is tape[0]
-        assert isinstance(out, Adjoint)
-        assert isinstance(out.base, Adjoint)
-        assert out.base.base.__class__ is qml.RX
+        assert not isinstance(out, Adjoint)
+        assert out.__class__ is qml.RX
         assert out.data == [x]
         assert out.wires == qml.wires.Wires("b")
 
+    def test_nested_adjoint_on_op(self):
+        """Test that taking the adjoint of an existing Adjoint operator
+        returns its base."""
+        base = qml.S(0)
+        with qml.tape.QuantumTape() as tape:
+            wrapped = adjoint(base)
+            out = adjoint(wrapped)
+
+        assert out is base
+        assert len(tape.operations) == 1
+        assert tape.operations[0] is base
+
 
 class TestNonLazyExecution:
     """Test the lazy=False keyword."""
@@ -202,6 +214,15 @@ class TestNonLazyExecution:
         assert isinstance(out, Adjoint)
         assert isinstance(out.base, qml.S)
 
+    def test_single_self_inverse_op_function(self):
+        """Test lazy=False returns the original operator for a self-inverse op."""
+        with qml.tape.QuantumTape() as tape:
+            out = adjoint(qml.PauliX, lazy=False)(0)
+
+        assert len(tape) == 1
+        assert out is tape[0]
+        assert isinstance(out, qml.PauliX)
+
     def test_mixed_function(self):
         """Test lazy=False with a function that applies operations of both types."""
         x = 1.23
@@ -341,6 +362,21 @@ class TestIntegration:
         assert qml.math.allclose(circ(x), expected_res)
         assert qml.math.allclose(jax.grad(circ)(x), expected_grad)
 
+    @pytest.mark.jax
+    def test_jax_vmap(self):
+        """Test that a circuit using the adjoint transform is traced once and
+        batched over its inputs with jax.vmap."""
+        import jax
+
+        @qml.qnode(qml.device("default.qubit", wires=1), diff_method="backprop", interface="jax")
+        def circ(x):
+            adjoint(qml.RX)(x, wires=0)
+            return qml.expval(qml.PauliY(0))
+
+        x = jax.numpy.array([0.234, 0.456, 0.789])
+        res = jax.vmap(circ)(x)
+        assert qml.math.allclose(res, jax.numpy.sin(x))
+
     @pytest.mark.torch
     @pytest.mark.parametrize("diff_method", ("backprop", "adjoint", "parameter-shift"))
     def test_gradient_torch(self, diff_method):
@@ -361,7 +397,7 @@ class TestIntegration:
 
     @pytest.mark.tf
     @pytest.mark.parametrize("diff_method", ("backprop", "adjoint", "parameter-shift"))
-    def test_gradient_torch(self, diff_method):
+    def test_gradient_tensorflow(self, diff_method):
         """Test gradients through the adjoint transform with tensorflow."""
 
         import tensorflow as tf
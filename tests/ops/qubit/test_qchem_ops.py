@@ -160,6 +160,13 @@ class TestSingleExcitation:
         assert np.allclose(res_dynamic, exp)
         assert np.allclose(res_static, exp)
 
+    def test_single_excitation_matrix_broadcasted(self):
+        """Tests that the SingleExcitation operation calculates the correct broadcasted matrix"""
+        phi = np.array([-0.1, 0.2, np.pi / 4])
+        res_static = qml.SingleExcitation.compute_matrix(phi)
+        exp = np.stack([SingleExcitation(p) for p in phi])
+        assert np.allclose(res_static, exp)
+
     @pytest.mark.parametrize("phi", [-0.1, 0.2, np.pi / 4])
     def test_single_excitation_decomp(self, phi):
         """Tests that the SingleExcitation operation calculates the correct decomposition.
@@ -364,6 +371,13 @@ class TestDoubleExcitation:
         assert np.allclose(res_dynamic, exp)
         assert np.allclose(res_static, exp)
 
+    def test_double_excitation_matrix_broadcasted(self):
+        """Tests that the DoubleExcitation operation calculates the correct broadcasted matrix"""
+        phi = np.array([-0.1, 0.2, np.pi / 4])
+        res_static = qml.DoubleExcitation.compute_matrix(phi)
+        exp = np.stack([DoubleExcitation(p) for p in phi])
+        assert np.allclose(res_static, exp)
+
     @pytest.mark.parametrize("phi", [-0.1, 0.2, np.pi / 4])
     def test_double_excitation_decomp(self, phi):
         """Tests that the DoubleExcitation operation calculates the correct decomposition"""
@@ -757,6 +771,14 @@ class TestOrbitalRotation:
 
         assert np.allclose(res, expected)
 
+    def test_adjoint_eager_shortcut(self):
+        """Test that the eager adjoint uses the operator-level shortcut rather
+        than expanding the decomposition."""
+        out = qml.adjoint(qml.OrbitalRotation, lazy=False)(0.1, wires=[0, 1, 2, 3])
+
+        assert isinstance(out, qml.OrbitalRotation)
+        assert qml.math.isclose(out.data[0], -0.1)
+
     @pytest.mark.autograd
     def test_autograd(self):
         """Tests that operations are computed correctly using the